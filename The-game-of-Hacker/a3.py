@@ -1,10 +1,15 @@
 from PIL import Image, ImageTk
 from a3_support import *
+from bisect import insort
+from collections import defaultdict
 import tkinter as tk
 import random
+import weakref
 
 
 class Entity:
+    # Entities hold no per-instance state
+    __slots__ = ()
 
     def display(self) -> str:
         """
@@ -20,6 +25,8 @@ class Entity:
 
 
 class Player(Entity):
+    __slots__ = ()
+    CHAR = PLAYER
 
     def display(self) -> str:
         """
@@ -28,10 +35,12 @@ class Player(Entity):
         Returns:
             The character representing a player: ’P’
         """
-        return PLAYER
+        return self.CHAR
 
 
 class Destroyable(Entity):
+    __slots__ = ()
+    CHAR = DESTROYABLE
 
     def display(self) -> str:
         """
@@ -40,10 +49,12 @@ class Destroyable(Entity):
         Returns:
             The character representing a destroyable: ’D’
         """
-        return DESTROYABLE
+        return self.CHAR
 
 
 class Collectable(Entity):
+    __slots__ = ()
+    CHAR = COLLECTABLE
 
     def display(self) -> str:
         """
@@ -52,10 +63,12 @@ class Collectable(Entity):
         Returns:
             The character representing a collectable: ’C’
         """
-        return COLLECTABLE
+        return self.CHAR
 
 
 class Blocker(Entity):
+    __slots__ = ()
+    CHAR = BLOCKER
 
     def display(self) -> str:
         """Return the character representing a blocker: ’B’
@@ -63,7 +76,31 @@ class Blocker(Entity):
         Returns:
             The character representing a blocker: ’B’
         """
-        return BLOCKER
+        return self.CHAR
+
+
+# Entities hold no state, so a single shared instance of each is used
+PLAYER_E = Player()
+DESTROYABLE_E = Destroyable()
+COLLECTABLE_E = Collectable()
+BLOCKER_E = Blocker()
+
+# The entity represented by each display character
+_ENTITY_SINGLETONS = {PLAYER: PLAYER_E,
+                      DESTROYABLE: DESTROYABLE_E,
+                      COLLECTABLE: COLLECTABLE_E,
+                      BLOCKER: BLOCKER_E}
+
+# How a shot affects each type of entity it reaches: a handler is called with
+# the game, the entity position and the shot type, and returns True if the
+# shot stops there
+_FIRE_HANDLERS = {
+    Blocker: lambda game, position, shot_type: True,
+    Destroyable: lambda game, position, shot_type: (
+        game._destroy(position) if shot_type == DESTROY else True),
+    Collectable: lambda game, position, shot_type: (
+        game._collect(position) if shot_type == COLLECT else True),
+}
 
 
 class Grid:
@@ -77,7 +114,12 @@ class Grid:
             the number of columns in the grid
         """
         self._size = size
+        # Entities are keyed by plain (x, y) tuples; a Position may be given
+        # wherever a position is expected, as it unpacks and compares equal
+        # to the tuple of its coordinates
         self._entities = {}
+        # The sorted y coordinates of the occupied cells in each column
+        self._by_column = defaultdict(list)
 
     def get_size(self) -> int:
         """Return the size of the grid
@@ -87,18 +129,21 @@ class Grid:
         """
         return self._size
 
-    def add_entity(self, position: Position, entity: Entity) -> None:
+    def add_entity(self, position: Tuple[int, int], entity: Entity) -> None:
         """Add a given entity into the grid at a specified position. This entity
          is only added if the position is valid.
 
          Parameters:
-             position(Position): A specified position
+             position(Tuple): A specified Position or (x, y) position
              entity(Entity): A given entity
          """
         if self.in_bounds(position):
-            self._entities[position] = entity
+            x, y = position
+            if (x, y) not in self._entities:
+                insort(self._by_column[x], y)
+            self._entities[(x, y)] = entity
 
-    def get_entities(self) -> Dict[Position, Entity]:
+    def get_entities(self) -> Dict[Tuple[int, int], Entity]:
         """Return the dictionary containing grid entities.
 
         Returns:
@@ -106,50 +151,90 @@ class Grid:
         """
         return self._entities
 
-    def get_entity(self, position: Position) -> Optional[Entity]:
+    def get_entity(self, position: Tuple[int, int]) -> Optional[Entity]:
         """Return a entity from the grid at a specific position or None if
         the position does not have a mapped entity.
 
         Parameters:
-            position(Position): A specified position
+            position(Tuple): A specified Position or (x, y) position
 
         Returns:
             A entity from the grid at a specific position or None
         """
         return self._entities.get(position)
 
-    def remove_entity(self, position: Position) -> None:
+    def remove_entity(self, position: Tuple[int, int]) -> None:
         """Remove an entity from the grid at a specified position.
 
         Parameters:
-            position(Position): A specified position
+            position(Tuple): A specified Position or (x, y) position
+        """
+        if self._entities.pop(position, None) is not None:
+            x, y = position
+            self._by_column[x].remove(y)
+
+    def get_column(self, x: int) -> Tuple[int, ...]:
+        """Return the y coordinates of the occupied cells in a column, from
+        the player's row outward.
+
+        Parameters:
+            x(int): The x coordinate of the column
+
+        Returns:
+            The sorted y coordinates of the entities in the column
         """
-        if position in self._entities:
-            self._entities.pop(position)
+        return tuple(self._by_column.get(x, ()))
 
     def serialise(self) -> Dict[Tuple[int, int], str]:
-        """Convert dictionary of Position and Entities into a simplified,
+        """Convert dictionary of positions and Entities into a simplified,
         serialised dictionary mapping tuples to characters, and return
         this serialised mapping.
 
         Returns:
             A simplified, serialised dictionary mapping tuples to characters
         """
-        return {(position.get_x(), position.get_y()): entity.display() for
+        return {position: entity.display() for
                 position, entity in self._entities.items()}
 
-    def in_bounds(self, position: Position) -> bool:
+    def in_bounds(self, position: Tuple[int, int]) -> bool:
         """Return a boolean based on whether the position is valid in terms of
         the dimensions of the grid.
 
         Parameters:
-            position(Position): A specified position
+            position(Tuple): A specified Position or (x, y) position
 
         Returns:
             Return True iff: x ≥ 0 and x < grid size, y ≥ 1 and y < grid size
         """
-        return 0 <= position.get_x() < self._size and \
-               1 <= position.get_y() < self._size
+        x, y = position
+        return 0 <= x < self._size and 1 <= y < self._size
+
+    def rotate(self, dx: int) -> None:
+        """Shift every entity horizontally by an offset, wrapping around
+        the edges of the grid.
+
+        Parameters:
+            dx(int): The horizontal offset of the rotation
+        """
+        size = self._size
+        self._entities = {((x + dx) % size, y): entity
+                          for (x, y), entity in self._entities.items()}
+        self._by_column = defaultdict(list, {
+            (x + dx) % size: ys for x, ys in self._by_column.items()})
+
+    def shift(self, dy: int) -> None:
+        """Shift every entity vertically by an offset, dropping the entities
+        which leave the grid.
+
+        Parameters:
+            dy(int): The vertical offset of the shift
+        """
+        self._entities = {(x, y + dy): entity
+                          for (x, y), entity in self._entities.items()
+                          if y + dy >= 1}
+        self._by_column = defaultdict(list, {
+            x: [y + dy for y in ys if y + dy >= 1]
+            for x, ys in self._by_column.items()})
 
     def renew_entities(self, entities):
         """Renew the entities position in the grid
@@ -158,6 +243,9 @@ class Grid:
              entities: Entities in the grid
         """
         self._entities = entities
+        self._by_column = defaultdict(list)
+        for x, y in sorted(entities):
+            self._by_column[x].append(y)
 
     def __repr__(self):
         """Return a representation of this Grid.
@@ -183,6 +271,9 @@ class Game:
         self._num_collected = 0
         self._num_destroyed = 0
         self._total_shots = 0
+        # Whether the scores or the shot count changed since they were drawn
+        self._score_dirty = True
+        self._shots_dirty = True
 
     def get_grid(self) -> Grid:
         """Return the instance of the grid held by the game.
@@ -224,6 +315,28 @@ class Game:
         """
         return self._total_shots
 
+    def take_score_change(self) -> bool:
+        """Return whether the number of collected or destroyed entities
+        changed since this method was last called.
+
+        Returns:
+            True if the scores need to be redrawn
+        """
+        changed = self._score_dirty
+        self._score_dirty = False
+        return changed
+
+    def take_shots_change(self) -> bool:
+        """Return whether the total of shots taken changed since this method
+        was last called.
+
+        Returns:
+            True if the total of shots needs to be redrawn
+        """
+        changed = self._shots_dirty
+        self._shots_dirty = False
+        return changed
+
     def rotate_grid(self, direction: str) -> None:
         """Rotate the positions of the entities within the grid depending on
         the direction they are being rotated.
@@ -232,13 +345,8 @@ class Game:
             direction(str):
             The direction the entities are being rotated
         """
-        new_entities = {}
-        direction = DIRECTIONS.index(direction)
-        next_pos = ROTATIONS[direction]
-        for current_position, entity in self._grid.get_entities().items():
-            x = (current_position.get_x() + next_pos[0]) % self._size
-            new_entities[Position(x, current_position.get_y())] = entity
-        self._grid.renew_entities(new_entities)
+        dx, _ = ROTATIONS[DIRECTIONS.index(direction)]
+        self._grid.rotate(dx)
 
     def _create_entity(self, display: str) -> Entity:
         """Uses a display character to create an Entity.
@@ -250,68 +358,48 @@ class Game:
         Returns:
             A specified entity
         """
-        if display == Player:
-            return Player()
-        elif display == DESTROYABLE:
-            return Destroyable()
-        elif display == COLLECTABLE:
-            return Collectable()
-        elif display == BLOCKER:
-            return Blocker()
-        else:
+        entity = _ENTITY_SINGLETONS.get(display)
+        if entity is None:
             raise NotImplementedError()
+        return entity
 
     def generate_entities(self) -> None:
         """
         Method given to the students to generate a random amount of entities to
         add into the game after each step
         """
-        # Generate amount
-        entity_count = random.randint(0, self.get_grid().get_size() - 3)
-        entities = random.choices(ENTITY_TYPES, k=entity_count)
-
-        # Blocker in a 1 in 4 chance
-        blocker = random.randint(1, 4) % 4 == 0
-
-        # UNCOMMENT THIS FOR TASK 3 (CSSE7030)
-        # bomb = False
-        # if not blocker:
-        #     bomb = random.randint(1, 4) % 4 == 0
+        grid = self._grid
+        size = self._size
+        last_row = size - 1
 
-        total_count = entity_count
+        # Generate amount, with a blocker in a 1 in 4 chance
+        entity_count = random.randint(0, size - 3)
+        entities = random.choices(ENTITY_TYPES, k=entity_count)
+        blocker = random.randint(1, 4) == 4
+        total_count = entity_count + blocker
+        if total_count == 0:
+            return
         if blocker:
-            total_count += 1
             entities.append(BLOCKER)
-
-        # UNCOMMENT THIS FOR TASK 3 (CSSE7030)
-        # if bomb:
-        #     total_count += 1
-        #     entities.append(BOMB)
-
-        entity_index = random.sample(range(self.get_grid().get_size()),
-                                     total_count)
+        entity_index = random.sample(range(size), total_count)
 
         # Add entities into grid
         for pos, entity in zip(entity_index, entities):
-            position = Position(pos, self.get_grid().get_size() - 1)
-            new_entity = self._create_entity(entity)
-            self.get_grid().add_entity(position, new_entity)
+            grid.add_entity((pos, last_row), self._create_entity(entity))
 
     def step(self) -> None:
         """This method moves all entities on the board by an offset of (0, -1).
         """
-        new_entities = {}
-        offset = MOVE
+        grid = self._grid
+        dy = MOVE[1]
+        # The game is lost once a Destroyable moves off the top row; entities
+        # are never above row 1, so only that row needs to be checked
+        if any(isinstance(grid.get_entity((x, 1)), Destroyable)
+               for x in range(self._size)):
+            self._game_over = True
+            return
         # Move the current existing entities
-        for position, entity in self._grid.get_entities().items():
-            y = position.get_y() + offset[1]
-            if y >= 1:
-                new_entities[Position(position.get_x(), y)] = entity
-            else:
-                if isinstance(entity, Destroyable):
-                    self._game_over = True
-                    break
-        self._grid.renew_entities(new_entities)
+        grid.shift(dy)
         # Add new entities to the grid
         self.generate_entities()
 
@@ -323,28 +411,42 @@ class Game:
             shot_type(str): The shot type is firing or collecting
         """
         self._total_shots += 1
-        x = self._player_position.get_x()
+        self._shots_dirty = True
+        x = self._player_position.x
         # Find out the entities in the player's column
-        for y in range(1, self._size):
-            position = Position(x, y)
-            entity = self._grid.get_entity(position)
-            if entity is not None:
-                if isinstance(entity, Blocker):
-                    break
-                elif isinstance(entity, Destroyable):
-                    if shot_type == DESTROY:
-                        self._num_destroyed += 1
-                        self._grid.remove_entity(position)
-                        break
-                    else:
-                        break
-                elif isinstance(entity, Collectable):
-                    if shot_type == COLLECT:
-                        self._num_collected += 1
-                        self._grid.remove_entity(position)
-                        break
-                    else:
-                        break
+        for y in self._grid.get_column(x):
+            position = (x, y)
+            handler = _FIRE_HANDLERS.get(type(self._grid.get_entity(position)))
+            if handler is not None and handler(self, position, shot_type):
+                break
+
+    def _destroy(self, position: Tuple[int, int]) -> bool:
+        """Destroy the Destroyable at a position with a shot.
+
+        Parameters:
+            position(Tuple): The position of the Destroyable
+
+        Returns:
+            True, as the shot stops at the destroyed entity
+        """
+        self._num_destroyed += 1
+        self._score_dirty = True
+        self._grid.remove_entity(position)
+        return True
+
+    def _collect(self, position: Tuple[int, int]) -> bool:
+        """Collect the Collectable at a position with a shot.
+
+        Parameters:
+            position(Tuple): The position of the Collectable
+
+        Returns:
+            True, as the shot stops at the collected entity
+        """
+        self._num_collected += 1
+        self._score_dirty = True
+        self._grid.remove_entity(position)
+        return True
 
     def has_won(self) -> bool:
         """Return True if the player has won the game.
@@ -386,6 +488,14 @@ class AbstractField(tk.Canvas):
         self._height = height
         self._cell_width = width // cols
         self._cell_height = height // rows
+        # Precompute (x_min, y_min, x_max, y_max, x_center, y_center)
+        # of every cell, indexed by [x][y]
+        cell_width, cell_height = self._cell_width, self._cell_height
+        self._bboxes = [[(x * cell_width, y * cell_height,
+                          (x + 1) * cell_width, (y + 1) * cell_height,
+                          x * cell_width + cell_width // 2,
+                          y * cell_height + cell_height // 2)
+                         for y in range(rows)] for x in range(cols)]
 
     def get_bbox(self, position: Tuple[int, int]):
         """Returns the bounding box for the position; this is a tuple
@@ -401,6 +511,9 @@ class AbstractField(tk.Canvas):
             The bounding box for the position
         """
         x, y = position
+        if 0 <= x < self._cols and 0 <= y < self._rows:
+            return self._bboxes[x][y][:4]
+        # Cells outside the field are not cached
         x_min = x * self._cell_width
         y_min = y * self._cell_height
         x_max = x_min + self._cell_width
@@ -434,6 +547,9 @@ class AbstractField(tk.Canvas):
         Returns:
             The graphics coordinates for the center of the cell
         """
+        x, y = position
+        if 0 <= x < self._cols and 0 <= y < self._rows:
+            return self._bboxes[x][y][4:]
         x_min, y_min, x_max, y_max = self.get_bbox(position)
         return (x_min + x_max) // 2, (y_min + y_max) // 2
 
@@ -445,9 +561,12 @@ class AbstractField(tk.Canvas):
             position(Tuple): The given position
             text(str): The text represents the kind of the entities
             fill(str): The default color
+
+        Returns:
+            The id of the created text item
         """
         x, y = self.get_position_center(position)
-        self.create_text(x, y, text=text, fill=fill)
+        return self.create_text(x, y, text=text, fill=fill)
 
 
 class GameField(AbstractField):
@@ -465,22 +584,71 @@ class GameField(AbstractField):
         """
         super().__init__(master, size, size, width, height, **kwargs)
         self._size = size
+        # Canvas item ids of each drawn cell and the entity they display
+        self._items = {}
+        self._last_entities = {}
+        self.draw_player_area()
 
-    def draw_grid(self, entities: Dict[Tuple[int, int], str]):
+    def draw_grid(self, entities: Dict[Tuple[int, int], Entity]):
         """Draws the entities (found in the Grid’s entity dictionary)
         in the game grid at their given position using a coloured rectangle
         with superimposed text identifying the entity.
 
+        Only the cells whose entity changed since the last draw are touched;
+        the canvas items of vacated cells are moved to newly occupied cells
+        showing the same entity, and created or deleted otherwise.
+
         Parameters:
             entities:
-            A dictionary contains the position and the name of the entities
+            A dictionary contains the position and the entities
         """
-        self.draw_player_area()
+        # Release the items of cells which have been vacated or changed
+        spare = {}
+        for position, entity in self._last_entities.items():
+            if entities.get(position) != entity:
+                spare.setdefault(entity, []).append(self._items.pop(position))
+
         for position, entity in entities.items():
-            x_min, y_min, x_max, y_max = self.get_bbox(position)
-            self.create_rectangle(x_min, y_min, x_max, y_max,
-                                  fill=COLOURS[entity])
-            self.annotate_position(position, entity)
+            if self._last_entities.get(position) == entity:
+                continue
+            if spare.get(entity):
+                items = spare[entity].pop()
+                self.move_cell(items, position)
+            else:
+                items = self.create_cell(position, entity.CHAR)
+            self._items[position] = items
+
+        # Delete the items which could not be reused
+        for items_list in spare.values():
+            for items in items_list:
+                self.delete(*items)
+        self._last_entities = dict(entities)
+
+    def create_cell(self, position, entity):
+        """Creates the canvas items displaying an entity at a position.
+
+        Parameters:
+            position(Tuple): The position of the entity
+            entity(str): The type of the entity
+
+        Returns:
+            The ids of the created canvas items
+        """
+        rectangle = self.create_rectangle(*self.get_bbox(position),
+                                          fill=COLOURS[entity])
+        text = self.annotate_position(position, entity)
+        return rectangle, text
+
+    def move_cell(self, items, position):
+        """Moves the canvas items created by create_cell to another position.
+
+        Parameters:
+            items(Tuple): The ids of the canvas items
+            position(Tuple): The new position of the items
+        """
+        rectangle, text = items
+        self.coords(rectangle, *self.get_bbox(position))
+        self.coords(text, *self.get_position_center(position))
 
     def draw_player_area(self):
         """Draws the grey area a player is placed on.
@@ -508,32 +676,38 @@ class ScoreBar(AbstractField):
             **kwargs: Additional named arguments
         """
         super().__init__(master, rows, 2, SCORE_WIDTH, MAP_HEIGHT, **kwargs)
+        # Draw the labels once; only the counts change afterwards
+        self.create_text(SCORE_WIDTH / 2, MAP_HEIGHT / self._rows / 2,
+                         text="Score", fill="white", font="Arial, 24")
+        self.annotate_position((0, 1), text="Collected", fill="white")
+        self.annotate_position((0, 2), text="Destroyed", fill="white")
+        self._collected_id = self.annotate_position((1, 1), text="0",
+                                                    fill="white")
+        self._destroyed_id = self.annotate_position((1, 2), text="0",
+                                                    fill="white")
 
     def draw_scores(self, collected, destroyed):
-        """Draws the score bar which contains the count of collected entities
+        """Updates the score bar with the count of collected entities
         and destroyed entities
 
         Parameters:
             collected(str): The number of collected entities
             destroyed(str): The number of destroyed entities
         """
-        self.create_text(SCORE_WIDTH / 2, MAP_HEIGHT / self._rows / 2,
-                         text="Score", fill="white", font="Arial, 24")
-        self.annotate_position((0, 1), text="Collected", fill="white")
-        self.annotate_position((0, 2), text="Destroyed", fill="white")
-        self.annotate_position((1, 1), text=collected, fill="white")
-        self.annotate_position((1, 2), text=destroyed, fill="white")
+        self.itemconfig(self._collected_id, text=str(collected))
+        self.itemconfig(self._destroyed_id, text=str(destroyed))
 
 
 class HackerController:
 
-    def __init__(self, master: tk.Tk, size):
+    def __init__(self, master: tk.Tk, size, field_cls=GameField):
         """HackerController acts as the controller for the Hacker game
 
         Parameters:
             master: Represents the master window
             size(int): Represents the number of rows (= number of columns)
             in the game map
+            field_cls: The GameField class used to display the game map
         """
         self._master = master
         self._size = size
@@ -545,19 +719,26 @@ class HackerController:
         self._title_label.pack(fill=tk.BOTH)
         self._frame = tk.Frame(self._master)
         self._frame.pack()
-        self._game_field = GameField(self._frame, size, MAP_WIDTH,
+        self._game_field = field_cls(self._frame, size, MAP_WIDTH,
                                      MAP_HEIGHT, bg=FIELD_COLOUR)
         self._game_field.pack(side=tk.LEFT)
 
         self._score_bar = ScoreBar(self._frame, size, bg=SCORE_COLOUR)
         self._score_bar.pack(side=tk.LEFT)
+        self.create_extra_widgets()
 
         # bind event with keypress
         self._master.bind("<Key>", self.handle_keypress)
 
         # Initialise the Game model
         self.draw(self._game)
-        self._master.after(2000, self.step)
+        self._after_id = self._master.after(2000, self.step)
+
+    def create_extra_widgets(self):
+        """Creates any further elements of the game below the game map.
+        The basic game has none.
+        """
+        pass
 
     def handle_keypress(self, event):
         """This method should be called when the user presses any key
@@ -567,6 +748,9 @@ class HackerController:
         Parameters:
             event: Represents the user press a key
         """
+        # The game does not change while it is paused or once it is over
+        if self._after_id is None or self.is_game_over():
+            return
         key_press = event.keysym.upper()
         if key_press in DIRECTIONS:
             self.handle_rotate(key_press)
@@ -574,16 +758,15 @@ class HackerController:
             self.handle_fire(key_press)
 
     def draw(self, game: Game):
-        """Clears and redraws the view based on the current game state.
+        """Redraws the view based on the current game state.
 
         Parameters:
             game: The current game state
         """
-        self._game_field.delete(tk.ALL)
-        self._game_field.draw_grid(game.get_grid().serialise())
-        self._score_bar.delete(tk.ALL)
-        self._score_bar.draw_scores(game.get_num_collected(),
-                                    game.get_num_destroyed())
+        self._game_field.draw_grid(game.get_grid().get_entities())
+        if game.take_score_change():
+            self._score_bar.draw_scores(game.get_num_collected(),
+                                        game.get_num_destroyed())
 
     def handle_rotate(self, direction):
         """Handles rotation of the entities and redrawing the game.
@@ -607,38 +790,103 @@ class HackerController:
         """
         self._game.fire(shot_type)
         self.draw(self._game)
+        if self.is_game_over():
+            self.pause()
+            self.show_end_screen()
 
     def step(self):
         """The step method is called every 2 seconds. This method triggers
         the step method for the game and updates the view accordingly.
+        Stepping stops once the game is over.
         """
         self._game.step()
         self.draw(self._game)
+        if self.is_game_over():
+            self._after_id = None
+            self.show_end_screen()
+            return
         # Use a recursion to call step
-        self._master.after(2000, self.step)
+        self._after_id = self._master.after(2000, self.step)
 
+    def is_game_over(self):
+        """Return True if the game has been won or lost.
 
-class ImageGameField(GameField):
+        Returns:
+            True if the game is over
+        """
+        return self._game.has_won() or self._game.has_lost()
 
-    def __init__(self, master, size, width, height, **kwargs):
-        super().__init__(master, size, width, height, **kwargs)
-        self._images = []
+    def show_end_screen(self):
+        """Displays the result of the game over the game map.
+        """
+        text = "YOU WIN!" if self._game.has_won() else "GAME OVER"
+        self._game_field.create_text(MAP_WIDTH // 2, MAP_HEIGHT // 2,
+                                     text=text, fill="white",
+                                     font=TITLE_FONT)
 
-    def draw_grid(self, entities: Dict[Tuple[int, int], str]):
-        """Draws the entities (found in the Grid’s entity dictionary)
-        in the game grid at their given position using a coloured rectangle
-        with superimposed text identifying the entity.
+    def pause(self):
+        """Stops the game from stepping until it is resumed.
+        """
+        if self._after_id is not None:
+            self._master.after_cancel(self._after_id)
+            self._after_id = None
+
+    def resume(self):
+        """Resumes stepping a paused game.
+        """
+        if self._after_id is None and not self.is_game_over():
+            self._after_id = self._master.after(2000, self.step)
+
+
+# The loaded entity images of each root window, released with the root
+_entity_images = weakref.WeakKeyDictionary()
+
+
+def _load_entity_image(entity, root):
+    """Load the image of an entity for a root window. Images belong to the
+    Tk interpreter of their root, so they are decoded once per root and
+    shared by every field in it; the cache also keeps the references Tk needs.
+
+    Parameters:
+        entity(str): The type of the entity
+        root: The root window the image is displayed in
+
+    Returns:
+        The image of the entity
+    """
+    images = _entity_images.setdefault(root, {})
+    image = images.get(entity)
+    if image is None:
+        image = ImageTk.PhotoImage(Image.open(f"images/{IMAGES[entity]}"),
+                                   master=root)
+        images[entity] = image
+    return image
+
+
+class ImageGameField(GameField):
+
+    def create_cell(self, position, entity):
+        """Creates the image displaying an entity at a position.
 
         Parameters:
-            entities(Dict):
-            A dictionary contains the position and the name of the entities
+            position(Tuple): The position of the entity
+            entity(str): The type of the entity
+
+        Returns:
+            The id of the created image item
         """
-        self.delete(tk.ALL)
-        self.draw_player_area()
+        x, y = self.get_position_center(position)
+        return self.display_image(x, y, entity),
 
-        for position, entity in entities.items():
-            x, y = self.get_position_center(position)
-            self.display_image(x, y, entity)
+    def move_cell(self, items, position):
+        """Moves the image created by create_cell to another position.
+
+        Parameters:
+            items(Tuple): The id of the image item
+            position(Tuple): The new position of the image
+        """
+        image, = items
+        self.coords(image, *self.get_position_center(position))
 
     def draw_player_area(self):
         """Draws the grey area a player is placed on.
@@ -657,11 +905,12 @@ class ImageGameField(GameField):
             x(int): The x position of the entity
             y(int): The y position of the entity
             entity(str): The type of the entity
+
+        Returns:
+            The id of the created image item
         """
-        image = Image.open(f"images/{IMAGES[entity]}")
-        image = ImageTk.PhotoImage(image)
-        self._images.append(image)
-        self.create_image(x, y, image=image)
+        image = _load_entity_image(entity, self.winfo_toplevel())
+        return self.create_image(x, y, image=image)
 
 
 class AdvancedHackerController(HackerController):
@@ -675,34 +924,17 @@ class AdvancedHackerController(HackerController):
             size(int): Represents the number of rows (= number of columns)
             in the game map
         """
-        self._master = master
-        self._size = size
-        self._game = Game(size)
-
-        # Draw the other elements in the game
-        self._title_label = tk.Label(master, text=TITLE, fg="white",
-                                     bg=TITLE_BG, font=TITLE_FONT)
-        self._title_label.pack(fill=tk.BOTH)
-        self._frame = tk.Frame(self._master)
-        self._frame.pack()
-        self._game_field = ImageGameField(self._frame, size, MAP_WIDTH,
-                                          MAP_HEIGHT, bg=FIELD_COLOUR)
-        self._game_field.pack(side=tk.LEFT)
+        super().__init__(master, size, field_cls=ImageGameField)
 
-        self._score_bar = ScoreBar(self._frame, size, bg=SCORE_COLOUR)
-        self._score_bar.pack(side=tk.LEFT)
-        self._status_bar = StatusBar(self._master)
+    def create_extra_widgets(self):
+        """Creates the status bar below the game map.
+        """
+        self._status_bar = StatusBar(self._master,
+                                     pause_command=self.toggle_pause)
         self._status_bar.pack()
 
-        # bind event with keypress
-        self._master.bind("<Key>", self.handle_keypress)
-
-        # Initialise the Game model
-        self.draw(self._game)
-        self._master.after(2000, self.step)
-
     def draw(self, game):
-        """Clears and redraws the view based on the current game state and
+        """Redraws the view based on the current game state and
         update the total shot count number in the status bar
 
         Parameters:
@@ -710,25 +942,31 @@ class AdvancedHackerController(HackerController):
         """
         super().draw(game)
         # Update the total shot count number
-        self._status_bar.total_shots_count(game.get_total_shots())
+        if game.take_shots_change():
+            self._status_bar.total_shots_count(game.get_total_shots())
 
-    def step(self):
-        """The step method is called every 2 seconds. This method triggers
-        the step method for the game and updates the view accordingly."""
-        self._game.step()
-        self.draw(self._game)
-        # Use a recursion to call step
-        self._master.after(2000, self.step)
+    def toggle_pause(self):
+        """Pauses a running game or resumes a paused one, and updates
+        the pause button accordingly. A finished game cannot be resumed.
+        """
+        if self.is_game_over():
+            return
+        if self._after_id is None:
+            self.resume()
+        else:
+            self.pause()
+        self._status_bar.set_paused(self._after_id is None)
 
 
 class StatusBar(tk.Frame):
 
-    def __init__(self, master, **kwargs):
+    def __init__(self, master, pause_command=None, **kwargs):
         """ A StatusBar class that inherits from tk.Frame. In this frame,
         it includes a shot counter, a game timer and a ‘Pause/Play’ button
 
         Parameters:
             master: Represents the master window
+            pause_command: Called when the ‘Pause/Play’ button is pressed
             **kwargs: Additional named arguments
         """
         super().__init__(master, **kwargs)
@@ -737,7 +975,8 @@ class StatusBar(tk.Frame):
         self._total_shots.pack(side=tk.LEFT, padx=MAP_WIDTH // 5)
         self._timer_label = tk.Label(master, text="Timer \n 0m 0s")
         self._timer_label.pack(side=tk.LEFT, padx=MAP_WIDTH // 10)
-        self._pause_button = tk.Button(master, text="Pause")
+        self._pause_button = tk.Button(master, text="Pause",
+                                       command=pause_command)
         self._pause_button.pack(side=tk.RIGHT, padx=SCORE_WIDTH // 2.5)
 
     def total_shots_count(self, total_shots):
@@ -748,6 +987,14 @@ class StatusBar(tk.Frame):
         """
         self._total_shots.config(text=f"Total Shot \n {total_shots}")
 
+    def set_paused(self, paused):
+        """Display whether the game is paused on the ‘Pause/Play’ button
+
+        Parameters:
+            paused(bool): Whether the game is paused
+        """
+        self._pause_button.config(text="Play" if paused else "Pause")
+
 
 def start_game(root, TASK=TASK):
     controller = HackerController
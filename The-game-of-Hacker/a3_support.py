@@ -1,3 +1,4 @@
+from collections import namedtuple
 from typing import Tuple, Optional, Dict, List
 
 PLAYER = "P"
@@ -49,7 +50,7 @@ IMAGES = {COLLECTABLE: "C.png",
 GRID_SIZE = 7
 
 
-class Position:
+class Position(namedtuple("Position", "x y")):
     """
     The position class represents a location in a 2D grid.
 
@@ -57,6 +58,9 @@ class Position:
     The x and y coordinates are assumed to be non-negative whole numbers which
     represent a square in a 2D grid.
 
+    Positions are named tuples, so they can be unpacked, hashed and compared
+    for equality like (x, y) tuples.
+
     Examples:
         >>> position = Position(2, 4)
         >>> position
@@ -65,27 +69,20 @@ class Position:
         2
         >>> position.get_y()
         4
+        >>> position.x
+        2
+        >>> position == (2, 4)
+        True
     """
-
-    def __init__(self, x: int, y: int):
-        """
-        The position class is constructed from the x and y coordinate which the
-        position represents.
-
-        Parameters:
-            x: The x coordinate of the position
-            y: The y coordinate of the position
-        """
-        self._x = x
-        self._y = y
+    __slots__ = ()
 
     def get_x(self) -> int:
         """Returns the x coordinate of the position."""
-        return self._x
+        return self.x
 
     def get_y(self) -> int:
         """Returns the y coordinate of the position."""
-        return self._y
+        return self.y
 
     def add(self, position: "Position") -> "Position":
         """
@@ -108,7 +105,7 @@ class Position:
             A new position representing the current position plus
             the given position.
         """
-        return Position(self._x + position.get_x(), self._y + position.get_y())
+        return Position(self.x + position.x, self.y + position.y)
 
     def subtract(self, position: "Position") -> "Position":
         """
@@ -131,40 +128,7 @@ class Position:
             A new position representing the current position plus
             the given position.
         """
-        return Position(self._x - position.get_x(), self._y - position.get_y())
-
-    def __eq__(self, other: object) -> bool:
-        """
-        Return whether the given other object is equal to this position.
-
-        If the other object is not a Position instance, returns False.
-        If the other object is a Position instance and the
-        x and y coordinates are equal, return True.
-
-        Parameters:
-            other: Another instance to compare with this position.
-        """
-        # an __eq__ method needs to support any object for example
-        # so it can handle `Position(1, 2) == 2`
-        # https://www.pythontutorial.net/python-oop/python-__eq__/
-        if not isinstance(other, Position):
-            return False
-        return self.get_x() == other.get_x() and self.get_y() == other.get_y()
-
-    def __hash__(self) -> int:
-        """
-        Calculate and return a hash code value for this position instance.
-
-        This allows Position instances to be used as keys in dictionaries.
-
-        A hash should be based on the unique data of a class, in the case
-        of the position class, the unique data is the x and y values.
-        Therefore, we can calculate an appropriate hash by hashing a tuple of
-        the x and y values.
-
-        Reference: https://stackoverflow.com/questions/17585730/what-does-hash-do-in-python
-        """
-        return hash((self.get_x(), self.get_y()))
+        return Position(self.x - position.x, self.y - position.y)
 
     def __repr__(self) -> str:
         """
@@ -179,7 +143,7 @@ class Position:
             >>> Position(12, 21).__repr__()
             'Position(12, 21)'
         """
-        return f"Position({self.get_x()}, {self.get_y()})"
+        return f"Position({self.x}, {self.y})"
 
     def __str__(self) -> str:
         """
@@ -204,9 +168,9 @@ class Position:
         """
         if not isinstance(other, Position):
             return False
-        if self._y == other.get_y() and self._x < other.get_x():
+        if self.y == other.y and self.x < other.x:
             return True
-        if self._y < other.get_y():
+        if self.y < other.y:
             return True
         return False
 
@@ -225,9 +189,9 @@ class Position:
         """
         if not isinstance(other, Position):
             return False
-        if self._y == other.get_y() and self._x <= other.get_x():
+        if self.y == other.y and self.x <= other.x:
             return True
-        if self._y <= other.get_y():
+        if self.y <= other.y:
             return True
         return False
 
@@ -245,9 +209,9 @@ class Position:
         """
         if not isinstance(other, Position):
             return False
-        if self._y == other.get_y() and self._x > other.get_x():
+        if self.y == other.y and self.x > other.x:
             return True
-        if self._y > other.get_y():
+        if self.y > other.y:
             return True
         return False
 
@@ -266,8 +230,8 @@ class Position:
         """
         if not isinstance(other, Position):
             return False
-        if self._y == other.get_y() and self._x >= other.get_x():
+        if self.y == other.y and self.x >= other.x:
             return True
-        if self._y >= other.get_y():
+        if self.y >= other.y:
             return True
         return False